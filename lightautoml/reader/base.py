@@ -9,6 +9,7 @@ from typing import List
 from typing import Mapping
 from typing import Optional
 from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import TypeVar
 from typing import Union
@@ -20,6 +21,8 @@ import pandas as pd
 
 from pandas import DataFrame
 from pandas import Series
+from pandas.api.types import is_datetime64_any_dtype
+from pandas.api.types import is_numeric_dtype
 
 from ..dataset.base import array_attr_roles
 from ..dataset.base import valid_array_attributes
@@ -41,6 +44,7 @@ from .guess_roles import rule_based_cat_handler_guess
 from .guess_roles import rule_based_roles_guess
 from .seq import IDSInd
 from .seq import TopInd
+from .utils import encode_classes
 from .utils import set_sklearn_folds
 
 
@@ -58,6 +62,8 @@ UserDefinedRolesSequence = Sequence[UserDefinedRole]
 UserRolesDefinition = Optional[Union[UserDefinedRole, UserDefinedRolesDict, UserDefinedRolesSequence]]
 
 attrs_dict = dict(zip(array_attr_roles, valid_array_attributes))
+# kinds of numpy numeric dtypes, same as np.issubdtype(dtype, np.number) but without walking types hierarchy
+numeric_kinds = frozenset("iufcm")
 
 
 class Reader:
@@ -76,12 +82,37 @@ class Reader:
 
     """
 
+    # fitted state that is transferred to a new reader by from_reader
+    _copyable_attrs = (
+        "_roles",
+        "_dropped_features",
+        "_used_array_attrs",
+        "_used_features",
+        "_used_features_set",
+        "_roles_by_type",
+    )
+
     def __init__(self, task: Task, *args: Any, **kwargs: Any):
         self.task = task
         self._roles = {}
         self._dropped_features = []
         self._used_array_attrs = {}
         self._used_features = []
+        self._used_features_set: Set[str] = set()
+        self._roles_by_type: Dict[str, List[str]] = {}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore pickled reader, indexes missing in readers pickled by older versions are rebuilt.
+
+        Args:
+            state: Attributes of pickled reader.
+
+        """
+        self.__dict__.update(state)
+        if "_used_features_set" not in state:
+            self._used_features_set = set(self._used_features)
+        if "_roles_by_type" not in state:
+            self._upd_roles_by_type()
 
     @property
     def roles(self) -> RolesDict:
@@ -135,6 +166,7 @@ class Reader:
         if remove is not None:
             curr_feats = curr_feats - set(remove)
         self._used_features = list(curr_feats)
+        self._used_features_set = curr_feats
 
     @classmethod
     def from_reader(cls, reader: "Reader", **kwargs) -> "Reader":
@@ -151,10 +183,8 @@ class Reader:
 
         """
         new_reader = cls(reader.task, **kwargs)
-
-        for attr in reader.__dict__:
-            if attr[0] == "_":
-                cls.__dict__[attr] = getattr(reader, attr)
+        # fitted state is copied, so fitting new reader doesn't change the source one
+        new_reader.__dict__.update({attr: deepcopy(getattr(reader, attr)) for attr in cls._copyable_attrs})
 
         return new_reader
 
@@ -168,12 +198,13 @@ class Reader:
             Array with column names.
 
         """
-        names = []
-        for col, role in self.roles.items():
-            if role.name == col_type:
-                names.append(col)
+        return list(self._roles_by_type.get(col_type, []))
 
-        return names
+    def _upd_roles_by_type(self):
+        """Rebuild index of columns names by role type, should be called after roles are changed."""
+        self._roles_by_type = {}
+        for col, role in self.roles.items():
+            self._roles_by_type.setdefault(role.name, []).append(col)
 
 
 class PandasToPandasReader(Reader):
@@ -261,6 +292,18 @@ class PandasToPandasReader(Reader):
         self.params = kwargs
         self.class_mapping: Optional[Union[Mapping, Dict[str, Mapping]]] = None
         self._n_classes: Optional[int] = None
+        self._default_roles: Dict[str, RoleType] = {}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore pickled reader, default roles cache is created if it's missing.
+
+        Args:
+            state: Attributes of pickled reader.
+
+        """
+        super().__setstate__(state)
+        if "_default_roles" not in state:
+            self._default_roles = {}
 
     def fit_read(
         self, train_data: DataFrame, features_names: Any = None, roles: UserDefinedRolesDict = None, **kwargs: Any
@@ -285,8 +328,6 @@ class PandasToPandasReader(Reader):
         # to automl format {'feat0': RoleX, 'feat1': RoleX, 'TARGET': RoleY, ...}
         parsed_roles = roles_parser(roles)
         # transform str role definition to automl ColumnRole
-        attrs_dict = dict(zip(array_attr_roles, valid_array_attributes))
-
         for feat in parsed_roles:
             r = parsed_roles[feat]
             if isinstance(r, str):
@@ -294,22 +335,21 @@ class PandasToPandasReader(Reader):
                 r = self._get_default_role_from_str(r)
 
             # check if column is defined like target/group/weight etc ...
-            if r.name in attrs_dict:
+            attr = attrs_dict.get(r.name)
+            if attr is not None:
                 # defined in kwargs is rewritten.. TODO: Maybe raise warning if rewritten?
                 # TODO: Think, what if multilabel or multitask? Multiple column target ..
                 # TODO: Maybe for multilabel/multitask make target only available in kwargs??
-                if ((self.task.name == "multi:reg") or (self.task.name == "multilabel")) and (
-                    attrs_dict[r.name] == "target"
-                ):
-                    if attrs_dict[r.name] in kwargs:
-                        kwargs[attrs_dict[r.name]].append(feat)
-                        self._used_array_attrs[attrs_dict[r.name]].append(feat)
+                if ((self.task.name == "multi:reg") or (self.task.name == "multilabel")) and (attr == "target"):
+                    if attr in kwargs:
+                        kwargs[attr].append(feat)
+                        self._used_array_attrs[attr].append(feat)
                     else:
-                        kwargs[attrs_dict[r.name]] = [feat]
-                        self._used_array_attrs[attrs_dict[r.name]] = [feat]
+                        kwargs[attr] = [feat]
+                        self._used_array_attrs[attr] = [feat]
                 else:
-                    self._used_array_attrs[attrs_dict[r.name]] = feat
-                    kwargs[attrs_dict[r.name]] = train_data.loc[:, feat]
+                    self._used_array_attrs[attr] = feat
+                    kwargs[attr] = train_data.loc[:, feat]
                 r = DropRole()
 
             # add new role
@@ -323,11 +363,13 @@ class PandasToPandasReader(Reader):
 
         # TODO: Check target and task
         # get subsample if it needed
-        subsample = train_data
-        if self.samples is not None and self.samples < subsample.shape[0]:
-            subsample = subsample.sample(self.samples, axis=0, random_state=42)
+        subsample = self._get_subsample(train_data)
+
+        # simple roles guess for all features without user defined role at once
+        guessed_roles, num_cat_feats = self._guess_fit_roles(subsample, parsed_roles, roles)
 
         # infer roles
+        kept_roles, dropped_features = {}, []
         for feat in subsample.columns:
             assert isinstance(
                 feat, str
@@ -337,47 +379,28 @@ class PandasToPandasReader(Reader):
                 # handle datetimes
                 if r.name == "Datetime":
                     # try if it's ok to infer date with given params
-                    try:
-                        _ = pd.to_datetime(
-                            subsample[feat],
-                            format=r.format,
-                            origin=r.origin,
-                            unit=r.unit,
-                        )
-                    except ValueError:
-                        raise ValueError("Looks like given datetime parsing params are not correctly defined")
+                    self._check_datetime_params(subsample[feat], r)
 
                 # replace default category dtype for numeric roles dtype if cat col dtype is numeric
                 if r.name == "Category":
-                    # default category role
-                    cat_role = self._get_default_role_from_str("category")
                     # check if role with dtypes was exactly defined
-                    try:
-                        flg_default_params = feat in roles["category"]
-                    except KeyError:
-                        flg_default_params = False
-
-                    if (
-                        flg_default_params
-                        and not np.issubdtype(cat_role.dtype, np.number)
-                        and np.issubdtype(subsample.dtypes[feat], np.number)
-                    ):
-                        r.dtype = self._get_default_role_from_str("numeric").dtype
+                    if feat in num_cat_feats:
+                        r.dtype = self._get_cached_default_role("numeric").dtype
 
             else:
-                # if no - infer
-                if self._is_ok_feature(subsample[feat]):
-                    r = self._guess_role(subsample[feat])
+                # if no - take inferred, features that are not ok are dropped
+                r = guessed_roles.get(feat, DropRole())
 
-                else:
-                    r = DropRole()
-
-            # set back
+            # collect to set back at once
             if r.name != "Drop":
-                self._roles[feat] = r
-                self._used_features.append(feat)
+                kept_roles[feat] = r
             else:
-                self._dropped_features.append(feat)
+                dropped_features.append(feat)
+
+        self._roles.update(kept_roles)
+        self._used_features.extend(kept_roles)
+        self._used_features_set.update(kept_roles)
+        self._dropped_features.extend(dropped_features)
 
         assert len(self.used_features) > 0, "All features are excluded for some reasons"
         # assert len(self.used_array_attrs) > 0, 'At least target should be defined in train dataset'
@@ -385,13 +408,13 @@ class PandasToPandasReader(Reader):
 
         folds = set_sklearn_folds(
             self.task,
-            kwargs["target"].values,
+            kwargs["target"].to_numpy(),
             cv=self.cv,
             random_state=self.random_state,
             group=None if "group" not in kwargs else kwargs["group"],
         )
         if folds is not None:
-            kwargs["folds"] = Series(folds, index=train_data.index)
+            kwargs["folds"] = Series(folds, index=train_data.index, copy=False)
 
         # get dataset
         dataset = PandasDataset(train_data[self.used_features], self.roles, task=self.task, **kwargs)
@@ -403,6 +426,8 @@ class PandasToPandasReader(Reader):
             self._roles = {x: new_roles[x] for x in new_roles if x not in droplist}
             dataset = PandasDataset(train_data[self.used_features], self.roles, task=self.task, **kwargs)
 
+        self._upd_roles_by_type()
+
         return dataset
 
     def _create_target(self, target: Union[Series, DataFrame]):
@@ -431,7 +456,7 @@ class PandasToPandasReader(Reader):
             # TODO: interpretation
 
         else:
-            assert not np.isnan(target.values).any(), "Nan in target detected"
+            assert not target.isna().values.any(), "Nan in target detected"
         return target
 
     def check_class_target(self, target) -> Tuple[pd.Series, Optional[Union[Mapping, Dict[str, Mapping]]]]:
@@ -446,10 +471,9 @@ class PandasToPandasReader(Reader):
 
         # if we have multiclass, cv parameter should be less or equal than quantity of samples in the smallest class
         if self.task.name == "multiclass":
-            # smallest - quantity of samples in the smallest class
-            target_val_counts = target.value_counts(dropna=False)
-            smallest = int(target_val_counts.values[-1])
-            smallest_class = target_val_counts.index[-1]
+            # smallest - quantity of samples in the smallest class, counts are sorted in descending order
+            smallest = int(cnts.values[-1])
+            smallest_class = cnts.index[-1]
             if smallest == 1:
                 # some class is represented by 1 sample, so we cannot split dataset correctly
                 raise ValueError(
@@ -471,7 +495,8 @@ class PandasToPandasReader(Reader):
 
         # case - create mapping
         class_mapping = {n: x for (x, n) in enumerate(unqiues)}
-        return target.map(class_mapping).astype(np.int32), class_mapping
+        target = Series(encode_classes(target, class_mapping).astype(np.int32), index=target.index, name=target.name)
+        return target, class_mapping
 
     def _get_default_role_from_str(self, name) -> RoleType:
         """Get default role for string name according to automl's defaults and user settings.
@@ -491,12 +516,32 @@ class PandasToPandasReader(Reader):
 
         return ColumnRole.from_string(name, **role_params)
 
+    def _get_cached_default_role(self, name: str) -> RoleType:
+        """Get default role for string name, created once per reader.
+
+        Role is shared between calls, so it's only for reading default params.
+        Use :meth:`_get_default_role_from_str` to get role to assign to feature.
+
+        Args:
+            name: name of role to get.
+
+        Returns:
+            role object.
+
+        """
+        name = name.lower()
+        if name not in self._default_roles:
+            self._default_roles[name] = self._get_default_role_from_str(name)
+
+        return self._default_roles[name]
+
     def _guess_role(self, feature: Series) -> RoleType:
         """Try to infer role, simple way.
 
         If convertible to float -> number.
         Else if convertible to datetime -> datetime.
         Else category.
+        Parsing warnings are not silenced here, :meth:`_guess_roles` does it for all columns at once.
 
         Args:
             feature: Column from dataset.
@@ -506,25 +551,24 @@ class PandasToPandasReader(Reader):
 
         """
         # TODO: Plans for advanced roles guessing
+        # all checks below hold for column if they hold for all of its unique values
+        if isinstance(feature.dtype, pd.CategoricalDtype):
+            feature = Series(feature.cat.categories)
         # check if default numeric dtype defined
-        num_dtype = self._get_default_role_from_str("numeric").dtype
+        num_dtype = self._get_cached_default_role("numeric").dtype
         # check if feature is number
         try:
             _ = feature.astype(num_dtype)
             return NumericRole(num_dtype)
-        except ValueError:
-            pass
-        except TypeError:
+        except (ValueError, TypeError):
             pass
 
         # check if default format is defined
-        date_format = self._get_default_role_from_str("datetime").format
+        date_format = self._get_cached_default_role("datetime").format
         # check if it's datetime
         dt_role = DatetimeRole(np.datetime64, date_format=date_format)
         try:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore")
-                t = cast(pd.Series, pd.to_datetime(feature, format=date_format))
+            t = cast(pd.Series, pd.to_datetime(feature, format=date_format))
         except (ValueError, AttributeError, TypeError):
             # else category
             return CategoryRole(object)
@@ -538,6 +582,85 @@ class PandasToPandasReader(Reader):
         except:
             return CategoryRole(object)
 
+    def _get_subsample(self, data: DataFrame) -> DataFrame:
+        """Get rows subsample to infer roles on, if it needed.
+
+        Rows are taken in sorted order, so every column is read sequentially.
+        Subsample is used only to infer roles, so integer columns are downcasted to the smallest dtype.
+
+        Args:
+            data: Dataset.
+
+        Returns:
+            Subsample of dataset.
+
+        """
+        if self.samples is None or self.samples >= data.shape[0]:
+            return data
+
+        idx = np.random.RandomState(self.random_state).choice(data.shape[0], self.samples, replace=False)
+        subsample = data.take(np.sort(idx))
+        # numpy counts timedelta64 as integer, so only plain integer columns are selected by dtype kind
+        int_cols = [
+            col for col, dtype in subsample.dtypes.items() if isinstance(dtype, np.dtype) and dtype.kind in "iu"
+        ]
+        for col in int_cols:
+            subsample[col] = pd.to_numeric(subsample[col], downcast="integer")
+
+        return subsample
+
+    def _guess_roles(self, data: Union[DataFrame, Mapping[str, Series]]) -> RolesDict:
+        """Infer roles for several columns at once, simple way.
+
+        Columns of numeric and datetime dtypes are resolved by dtype only,
+        other columns are checked with :meth:`_guess_role`.
+
+        Args:
+            data: Dataset or dict of columns to infer roles for.
+
+        Returns:
+            Dict of features roles.
+
+        """
+        num_dtype = self._get_cached_default_role("numeric").dtype
+        date_format = self._get_cached_default_role("datetime").format
+
+        roles = {}
+        # parsing warnings are silenced once for all columns
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            for feat, feature in data.items():
+                if is_numeric_dtype(feature.dtype):
+                    roles[feat] = NumericRole(num_dtype)
+                elif is_datetime64_any_dtype(feature.dtype):
+                    roles[feat] = DatetimeRole(np.datetime64, date_format=date_format)
+                else:
+                    roles[feat] = self._guess_role(feature)
+
+        return roles
+
+    def _check_datetime_params(self, feature: Series, role: DatetimeRole):
+        """Check if it's ok to parse datetime column with role params.
+
+        Columns of datetime dtype are not checked, for others
+        only first non-nan values are parsed, to keep the check cheap.
+
+        Args:
+            feature: Column from dataset.
+            role: Datetime role defined by user.
+
+        Raises:
+            ValueError: If values can't be parsed with given params.
+
+        """
+        if is_datetime64_any_dtype(feature.dtype):
+            return
+
+        try:
+            _ = pd.to_datetime(feature.dropna().head(32), format=role.format, origin=role.origin, unit=role.unit)
+        except ValueError:
+            raise ValueError("Looks like given datetime parsing params are not correctly defined")
+
     def _is_ok_feature(self, feature) -> bool:
         """Check if column is filled well to be a feature.
 
@@ -548,12 +671,123 @@ class PandasToPandasReader(Reader):
             ``True`` if nan ratio and frequency are not high.
 
         """
-        if feature.isnull().mean() >= self.max_nan_rate:
+        # empty column has no values to be a feature
+        if feature.shape[0] == 0:
             return False
-        if (feature.value_counts().values[0] / feature.shape[0]) >= self.max_constant_rate:
+
+        if isinstance(feature.dtype, pd.CategoricalDtype):
+            # categorical is already coded the same way as factorize does
+            codes = feature.cat.codes.to_numpy()
+        else:
+            values = feature.to_numpy()
+            # numpy integers have no nans and, if range is small, are counted directly without hashing
+            if values.dtype.kind in "iu":
+                min_val = values.min()
+                if int(values.max()) - int(min_val) < (1 << 20):
+                    # shift straight into int64 in one pass, so narrow integers don't overflow,
+                    # large unsigned values wrap on cast, but their small differences stay exact
+                    counts = np.bincount(np.subtract(values, min_val, dtype=np.int64, casting="unsafe"))
+                    return (counts.max() / values.shape[0]) < self.max_constant_rate
+
+            try:
+                codes = pd.factorize(values)[0]
+            except TypeError:
+                # unhashable values, like lists, can't be factorized, so they are counted with value_counts
+                if feature.isnull().mean() >= self.max_nan_rate:
+                    return False
+                return (feature.value_counts().values[0] / feature.shape[0]) < self.max_constant_rate
+
+        # nans are coded as -1, so codes give both nan rate and values frequencies
+        nan_mask = codes < 0
+        if nan_mask.mean() >= self.max_nan_rate:
+            return False
+        # most frequent value count without sorting all the uniques
+        counts = np.bincount(codes[~nan_mask])
+        if counts.shape[0] > 0 and (counts.max() / codes.shape[0]) >= self.max_constant_rate:
             return False
         return True
 
+    def _get_ok_features(self, data: DataFrame, features: Sequence[str]) -> Dict[str, Series]:
+        """Select columns that are filled well to be features.
+
+        Nan rates are computed for all columns at once,
+        only columns that pass are checked for values frequency with :meth:`_is_ok_feature`.
+        Object columns are encoded to categorical first, so they are hashed once
+        and their roles are then checked once per unique value.
+
+        Args:
+            data: Dataset.
+            features: Names of columns to check.
+
+        Returns:
+            Dict of columns with not high nan ratio and frequency, to infer roles on.
+
+        """
+        nan_rate = data.isna().mean()
+
+        ok_features = {}
+        for feat in features:
+            if nan_rate[feat] >= self.max_nan_rate:
+                continue
+            feature = data[feat]
+            if feature.dtype == object:
+                feature = self._encode_object_feature(feature)
+            if self._is_ok_feature(feature):
+                ok_features[feat] = feature
+
+        return ok_features
+
+    @staticmethod
+    def _encode_object_feature(feature: Series) -> Series:
+        """Encode object column to categorical with categories in order of appearance.
+
+        Args:
+            feature: Column from dataset.
+
+        Returns:
+            Categorical copy of column or column itself, if its values are not hashable.
+
+        """
+        try:
+            codes, uniques = pd.factorize(feature, sort=False)
+        except TypeError:
+            # unhashable values, like lists, are checked as is
+            return feature
+
+        return Series(pd.Categorical.from_codes(codes, categories=uniques), index=feature.index, name=feature.name)
+
+    def _guess_fit_roles(
+        self, subsample: DataFrame, parsed_roles: RolesDict, roles: UserDefinedRolesDict
+    ) -> Tuple[RolesDict, Set[str]]:
+        """Infer roles of features without user defined role, shared by all ``fit_read`` variants.
+
+        Args:
+            subsample: Subsample of dataset to infer roles on.
+            parsed_roles: Dict of user defined features roles.
+            roles: Dict of features roles in user format.
+
+        Returns:
+            Inferred roles of well filled features without user defined role
+            and names of numeric columns given by "category" key, that should get numeric dtype.
+
+        """
+        guessed_roles = self._guess_roles(
+            self._get_ok_features(subsample, [feat for feat in subsample.columns if feat not in parsed_roles])
+        )
+        # columns with default category role keep numeric dtype, if default category dtype is not numeric
+        if np.dtype(self._get_cached_default_role("category").dtype).kind in numeric_kinds:
+            return guessed_roles, set()
+
+        cat_manual = roles.get("category", ())
+        cat_manual = {cat_manual} if isinstance(cat_manual, str) else set(cat_manual)
+        num_cat_feats = {
+            feat
+            for feat, dtype in zip(subsample.columns, subsample.dtypes)
+            if feat in cat_manual and isinstance(dtype, np.dtype) and dtype.kind in numeric_kinds
+        }
+
+        return guessed_roles, num_cat_feats
+
     def read(self, data: DataFrame, features_names: Any = None, add_array_attrs: bool = False) -> PandasDataset:
         """Read dataset with fitted metadata.
 
@@ -579,14 +813,21 @@ class PandasToPandasReader(Reader):
                 if array_attr == "target" and self.class_mapping is not None:
                     if len(val.shape) == 1:
                         val = Series(
-                            val.map(self.class_mapping).values,
+                            encode_classes(val, self.class_mapping),
                             index=data.index,
                             name=col_name,
                         )
                     else:
-                        for col in val.columns:
-                            if self.class_mapping[col] is not None:
-                                val.loc[:, col] = val.loc[:, col].map(self.class_mapping[col])
+                        # encoded columns are collected to a new frame instead of writing them back one by one
+                        val = DataFrame(
+                            {
+                                col: val[col]
+                                if self.class_mapping[col] is None
+                                else encode_classes(val[col], self.class_mapping[col])
+                                for col in val.columns
+                            },
+                            index=val.index,
+                        )
 
                 kwargs[array_attr] = val
 
@@ -615,7 +856,7 @@ class PandasToPandasReader(Reader):
             manual_roles = {}
         top_scores = []
         new_roles_dict = dataset.roles
-        advanced_roles_params = deepcopy(self.advanced_roles_params)
+        advanced_roles_params = dict(self.advanced_roles_params)
         drop_co = advanced_roles_params.pop("drop_score_co")
 
         # guess roles nor numerics
@@ -649,7 +890,7 @@ class PandasToPandasReader(Reader):
 
         # get top scores of feature
         if len(top_scores) > 0:
-            top_scores = pd.concat(top_scores, axis=0)
+            top_scores = top_scores[0] if len(top_scores) == 1 else pd.concat(top_scores, axis=0)
             # TODO: Add sample params
 
             null_scores = get_null_scores(
@@ -658,7 +899,11 @@ class PandasToPandasReader(Reader):
                 random_state=self.random_state,
                 subsample=self.samples,
             )
-            top_scores = pd.concat([null_scores, top_scores], axis=1).max(axis=1)
+            # elementwise max, nan scores are ignored
+            top_scores = Series(
+                np.fmax(null_scores.reindex(top_scores.index).values, np.asarray(top_scores, dtype=np.float64)),
+                index=top_scores.index,
+            )
             rejected = list(top_scores[top_scores < drop_co].index)
             logger.info3("Feats was rejected during automatic roles guess: {0}".format(rejected))
             new_roles_dict = {**new_roles_dict, **{x: DropRole() for x in rejected}}
@@ -666,6 +911,35 @@ class PandasToPandasReader(Reader):
         return new_roles_dict
 
 
+class _SeqMeta:
+    """Fitted metadata of sequential dataset.
+
+    Args:
+        roles: Roles of used features.
+        features: Names of used features.
+        attributes: Columns of array attributes, like group/weights.
+        seq_idx_data: Sequences indexes to build data.
+        seq_idx_target: Sequences indexes to build target.
+
+    """
+
+    __slots__ = ("roles", "features", "attributes", "seq_idx_data", "seq_idx_target")
+
+    def __init__(
+        self,
+        roles: RolesDict,
+        features: List[str],
+        attributes: Dict[str, str],
+        seq_idx_data: Optional[np.ndarray] = None,
+        seq_idx_target: Optional[np.ndarray] = None,
+    ):
+        self.roles = roles
+        self.features = features
+        self.attributes = attributes
+        self.seq_idx_data = seq_idx_data
+        self.seq_idx_target = seq_idx_target
+
+
 class DictToPandasSeqReader(PandasToPandasReader):
     """Reader with sequential support to convert :class:`~pandas.DataFrame` to AutoML's :class:`~lightautoml.dataset.np_pd_dataset.PandasDataset`.
 
@@ -754,12 +1028,22 @@ class DictToPandasSeqReader(PandasToPandasReader):
         self.ti = {}
         self.meta = {}
 
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore pickled reader, sequences metadata pickled by older versions as dicts is converted.
+
+        Args:
+            state: Attributes of pickled reader.
+
+        """
+        super().__setstate__(state)
+        self.meta = {name: _SeqMeta(**meta) if isinstance(meta, dict) else meta for name, meta in self.meta.items()}
+
     def create_ids(self, seq_data, plain_data, dataset_name):
         """Calculate ids for different seq tasks."""
         if self.seq_params[dataset_name]["case"] == "next_values":
             self.ti[dataset_name] = TopInd(
                 scheme=self.seq_params[dataset_name].get("scheme", None),
-                roles=self.meta[dataset_name]["roles"],
+                roles=self.meta[dataset_name].roles,
                 **self.seq_params[dataset_name]["params"],
             )
             self.ti[dataset_name].read(seq_data, plain_data)
@@ -770,16 +1054,23 @@ class DictToPandasSeqReader(PandasToPandasReader):
             )
             self.ti[dataset_name].read(seq_data, plain_data)
 
+    def _get_plain_used_features(self, plain_data: Optional[DataFrame]) -> List[str]:
+        """Get sorted names of used features from plain data."""
+        if plain_data is None:
+            return []
+
+        return plain_data.columns.intersection(pd.Index(self.used_features)).sort_values().tolist()
+
     def parse_seq(self, seq_dataset, plain_data, dataset_name, parsed_roles, roles):
         """Method to read sequential data."""
-        subsample = seq_dataset
-        if self.samples is not None and self.samples < subsample.shape[0]:
-            subsample = subsample.sample(self.samples, axis=0, random_state=42)
+        subsample = self._get_subsample(seq_dataset)
 
         seq_roles = {}
         seq_features = []
+        dropped_features = []
         kwargs = {}
         used_array_attrs = {}
+        guessed_roles, num_cat_feats = self._guess_fit_roles(subsample, parsed_roles, roles)
         for feat in seq_dataset.columns:
             assert isinstance(
                 feat, str
@@ -794,84 +1085,62 @@ class DictToPandasSeqReader(PandasToPandasReader):
 
                 if r.name == "Datetime" or r.name == "Date":
                     # try if it's ok to infer date with given params
-                    try:
-                        _ = pd.to_datetime(subsample[feat], format=r.format, origin=r.origin, unit=r.unit)
-                    except ValueError:
-                        raise ValueError("Looks like given datetime parsing params are not correctly defined")
+                    self._check_datetime_params(subsample[feat], r)
 
                 # replace default category dtype for numeric roles dtype if cat col dtype is numeric
                 if r.name == "Category":
-                    # default category role
-                    cat_role = self._get_default_role_from_str("category")
                     # check if role with dtypes was exactly defined
-                    try:
-                        flg_default_params = feat in roles["category"]
-                    except KeyError:
-                        flg_default_params = False
-
-                    if (
-                        flg_default_params
-                        and not np.issubdtype(cat_role.dtype, np.number)
-                        and np.issubdtype(subsample.dtypes[feat], np.number)
-                    ):
-                        r.dtype = self._get_default_role_from_str("numeric").dtype
+                    if feat in num_cat_feats:
+                        r.dtype = self._get_cached_default_role("numeric").dtype
 
                 if r.name == "Target":
                     r = self._get_default_role_from_str("numeric")
 
             else:
-                # if no - infer
-                if self._is_ok_feature(subsample[feat]):
-                    r = self._guess_role(subsample[feat])
-
-                else:
-                    r = DropRole()
+                # if no - take inferred, features that are not ok are dropped
+                r = guessed_roles.get(feat, DropRole())
 
             parsed_roles[feat] = r
 
-            if r.name in attrs_dict:
-                if attrs_dict[r.name] in ["target"]:
+            attr = attrs_dict.get(r.name)
+            if attr is not None:
+                if attr in ["target"]:
                     pass
                 else:
-                    kwargs[attrs_dict[r.name]] = seq_dataset[feat]
-                    used_array_attrs[attrs_dict[r.name]] = feat
+                    kwargs[attr] = seq_dataset[feat]
+                    used_array_attrs[attr] = feat
                     r = DropRole()
 
-            # set back
+            # collect to set back at once
             if r.name != "Drop":
-                self._roles[feat] = r
-                self._used_features.append(feat)
                 seq_roles[feat] = r
                 seq_features.append(feat)
             else:
-                self._dropped_features.append(feat)
+                dropped_features.append(feat)
+
+        self._roles.update(seq_roles)
+        self._used_features.extend(seq_features)
+        self._used_features_set.update(seq_features)
+        self._dropped_features.extend(dropped_features)
 
         assert len(seq_features) > 0, "All features are excluded for some reasons"
-        self.meta[dataset_name] = {}
-        self.meta[dataset_name]["roles"] = seq_roles
-        self.meta[dataset_name]["features"] = seq_features
-        self.meta[dataset_name]["attributes"] = used_array_attrs
+        self.meta[dataset_name] = _SeqMeta(roles=seq_roles, features=seq_features, attributes=used_array_attrs)
 
         self.create_ids(seq_dataset, plain_data, dataset_name)
-        self.meta[dataset_name].update(
-            **{
-                "seq_idx_data": self.ti[dataset_name].create_data(seq_dataset, plain_data=plain_data),
-                "seq_idx_target": self.ti[dataset_name].create_target(seq_dataset, plain_data=plain_data),
-            }
-        )
+        seq_idx_data = self.ti[dataset_name].create_data(seq_dataset, plain_data=plain_data)
+        seq_idx_target = self.ti[dataset_name].create_target(seq_dataset, plain_data=plain_data)
+        self.meta[dataset_name].seq_idx_data = seq_idx_data
+        self.meta[dataset_name].seq_idx_target = seq_idx_target
 
-        if self.meta[dataset_name]["seq_idx_target"] is not None:
-            assert len(self.meta[dataset_name]["seq_idx_data"]) == len(
-                self.meta[dataset_name]["seq_idx_target"]
-            ), "Time series ids don`t match"
+        if seq_idx_target is not None:
+            assert len(seq_idx_data) == len(seq_idx_target), "Time series ids don`t match"
 
+        # ids are created from the whole dataset, then only used features are projected once
         seq_dataset = SeqNumpyPandasDataset(
-            data=seq_dataset[self.meta[dataset_name]["features"]],
-            features=self.meta[dataset_name]["features"],
-            roles=self.meta[dataset_name]["roles"],
-            idx=self.meta[dataset_name]["seq_idx_target"]
-            if self.meta[dataset_name]["seq_idx_target"] is not None
-            else self.meta[dataset_name]["seq_idx_data"],
+            data=seq_dataset[seq_features],
+            features=seq_features,
+            roles=seq_roles,
+            idx=seq_idx_target if seq_idx_target is not None else seq_idx_data,
             name=dataset_name,
             scheme=self.seq_params[dataset_name].get("scheme", None),
             **kwargs,
@@ -901,7 +1170,7 @@ class DictToPandasSeqReader(PandasToPandasReader):
         # to automl format {'feat0': RoleX, 'feat1': RoleX, 'TARGET': RoleY, ...}
 
         plain_data, seq_data = train_data.get("plain", None), train_data.get("seq", None)
-        plain_features = set(plain_data.columns) if plain_data is not None else {}
+        plain_features = plain_data.columns if plain_data is not None else pd.Index([], dtype=object)
         parsed_roles = roles_parser(roles)
         # transform str role definition to automl ColumnRole
 
@@ -921,32 +1190,32 @@ class DictToPandasSeqReader(PandasToPandasReader):
 
             # check if column is defined like target/group/weight etc ...
             if feat in plain_features:
-                if r.name in attrs_dict:
+                attr = attrs_dict.get(r.name)
+                if attr is not None:
                     # defined in kwargs is rewritten.. TODO: Maybe raise warning if rewritten?
 
-                    if ((self.task.name == "multi:reg") or (self.task.name == "multilabel")) and (
-                        attrs_dict[r.name] == "target"
-                    ):
-                        if attrs_dict[r.name] in kwargs:
-                            kwargs[attrs_dict[r.name]].append(feat)
-                            self._used_array_attrs[attrs_dict[r.name]].append(feat)
+                    if ((self.task.name == "multi:reg") or (self.task.name == "multilabel")) and (attr == "target"):
+                        if attr in kwargs:
+                            kwargs[attr].append(feat)
+                            self._used_array_attrs[attr].append(feat)
                         else:
-                            kwargs[attrs_dict[r.name]] = [feat]
-                            self._used_array_attrs[attrs_dict[r.name]] = [feat]
+                            kwargs[attr] = [feat]
+                            self._used_array_attrs[attr] = [feat]
                     else:
-                        self._used_array_attrs[attrs_dict[r.name]] = feat
-                        kwargs[attrs_dict[r.name]] = plain_data.loc[:, feat]
+                        self._used_array_attrs[attr] = feat
+                        kwargs[attr] = plain_data.loc[:, feat]
                     r = DropRole()
 
                 # add new role
                 parsed_roles[feat] = r
-        # add target from seq dataset to plain
-        for seq_name, values in self.meta.items():
-            if values["seq_idx_target"] is not None:
-                kwargs["target"] = pd.DataFrame(
-                    seq_datasets[seq_name].to_sequence((slice(None), roles["target"])).data[:, :, 0].astype(float)
-                )
-                break
+        # add target from seq dataset to plain, it's taken from the first seq dataset with target ids
+        seq_with_target = next((name for name, values in self.meta.items() if values.seq_idx_target is not None), None)
+        if seq_with_target is not None:
+            target = seq_datasets[seq_with_target].to_sequence((slice(None), roles["target"])).data[:, :, 0]
+            # target is already float in seq data with numeric role, so it's not copied again
+            if not np.issubdtype(target.dtype, np.floating):
+                target = target.astype(np.float32)
+            kwargs["target"] = pd.DataFrame(target)
 
         assert "target" in kwargs, "Target should be defined"
         if isinstance(kwargs["target"], list):
@@ -959,11 +1228,13 @@ class DictToPandasSeqReader(PandasToPandasReader):
         # get subsample if it needed
         if plain_data is not None:
 
-            subsample = plain_data
-            if self.samples is not None and self.samples < subsample.shape[0]:
-                subsample = subsample.sample(self.samples, axis=0, random_state=42)
+            subsample = self._get_subsample(plain_data)
+
+            # simple roles guess for all features without user defined role at once
+            guessed_roles, num_cat_feats = self._guess_fit_roles(subsample, parsed_roles, roles)
 
             # infer roles
+            kept_roles, dropped_features = {}, []
             for feat in subsample.columns:
                 assert isinstance(
                     feat, str
@@ -973,45 +1244,31 @@ class DictToPandasSeqReader(PandasToPandasReader):
                     # handle datetimes
                     if r.name == "Datetime":
                         # try if it's ok to infer date with given params
-                        try:
-                            _ = pd.to_datetime(subsample[feat], format=r.format, origin=r.origin, unit=r.unit)
-                        except ValueError:
-                            raise ValueError("Looks like given datetime parsing params are not correctly defined")
+                        self._check_datetime_params(subsample[feat], r)
 
                     # replace default category dtype for numeric roles dtype if cat col dtype is numeric
                     if r.name == "Category":
-                        # default category role
-                        cat_role = self._get_default_role_from_str("category")
                         # check if role with dtypes was exactly defined
-                        try:
-                            flg_default_params = feat in roles["category"]
-                        except KeyError:
-                            flg_default_params = False
-
-                        if (
-                            flg_default_params
-                            and not np.issubdtype(cat_role.dtype, np.number)
-                            and np.issubdtype(subsample.dtypes[feat], np.number)
-                        ):
-                            r.dtype = self._get_default_role_from_str("numeric").dtype
+                        if feat in num_cat_feats:
+                            r.dtype = self._get_cached_default_role("numeric").dtype
 
                 else:
-                    # if no - infer
-                    if self._is_ok_feature(subsample[feat]):
-                        r = self._guess_role(subsample[feat])
-
-                    else:
-                        r = DropRole()
+                    # if no - take inferred, features that are not ok are dropped
+                    r = guessed_roles.get(feat, DropRole())
 
-                # set back
+                # collect to set back at once
                 if r.name != "Drop":
-                    self._roles[feat] = r
-                    self._used_features.append(feat)
+                    kept_roles[feat] = r
                 else:
-                    self._dropped_features.append(feat)
+                    dropped_features.append(feat)
+
+            self._roles.update(kept_roles)
+            self._used_features.extend(kept_roles)
+            self._used_features_set.update(kept_roles)
+            self._dropped_features.extend(dropped_features)
 
-            assert (
-                len(set(self.used_features) & set(subsample.columns)) > 0
+            assert not self._used_features_set.isdisjoint(
+                subsample.columns
             ), "All features are excluded for some reasons"
 
         if self.cv is not None:
@@ -1022,13 +1279,18 @@ class DictToPandasSeqReader(PandasToPandasReader):
                 random_state=self.random_state,
                 group=None if "group" not in kwargs else kwargs["group"],
             )
+            # folds array is wrapped as is, without copying
             kwargs["folds"] = Series(
-                folds, index=plain_data.index if plain_data is not None else np.arange(len(kwargs["target"]))
+                folds,
+                index=plain_data.index if plain_data is not None else pd.RangeIndex(len(kwargs["target"])),
+                copy=False,
             )
 
         # get dataset
-        self.plain_used_features = sorted(list(set(self.used_features) & set(plain_features)))
-        self.plain_roles = {key: value for key, value in self._roles.items() if key in set(self.plain_used_features)}
+        self.plain_used_features = self._get_plain_used_features(plain_data)
+        self.plain_roles = {
+            key: value for key, value in self._roles.items() if key in self._used_features_set and key in plain_features
+        }
 
         dataset = PandasDataset(
             plain_data[self.plain_used_features] if plain_data is not None else pd.DataFrame(),
@@ -1041,9 +1303,11 @@ class DictToPandasSeqReader(PandasToPandasReader):
             droplist = [x for x in new_roles if new_roles[x].name == "Drop" and not self._roles[x].force_input]
             self.upd_used_features(remove=droplist)
             self._roles = {x: new_roles[x] for x in new_roles if x not in droplist}
-            self.plain_used_features = sorted(list(set(self.used_features) & set(plain_features)))
+            self.plain_used_features = self._get_plain_used_features(plain_data)
             self.plain_roles = {
-                key: value for key, value in self._roles.items() if key in set(self.plain_used_features)
+                key: value
+                for key, value in self._roles.items()
+                if key in self._used_features_set and key in plain_features
             }
             dataset = PandasDataset(
                 plain_data[self.plain_used_features] if plain_data is not None else pd.DataFrame(),
@@ -1053,9 +1317,10 @@ class DictToPandasSeqReader(PandasToPandasReader):
             )
 
         for seq_name, values in self.meta.items():
-            seq_datasets[seq_name].idx = values["seq_idx_data"]
+            seq_datasets[seq_name].idx = values.seq_idx_data
 
         dataset.seq_data = seq_datasets
+        self._upd_roles_by_type()
 
         return dataset
 
@@ -1076,16 +1341,17 @@ class DictToPandasSeqReader(PandasToPandasReader):
         if seq_data is not None:
             for dataset_name, dataset in seq_data.items():
                 test_idx = self.ti[dataset_name].create_test(dataset, plain_data=plain_data)
+                meta = self.meta[dataset_name]
                 kwargs = {}
                 columns = set(dataset.columns)
-                for role, col in self.meta[dataset_name]["attributes"].items():
+                for role, col in meta.attributes.items():
                     if col in columns:
                         kwargs[role] = dataset[col]
 
                 seq_dataset = SeqNumpyPandasDataset(
-                    data=dataset[self.meta[dataset_name]["features"]],
-                    features=self.meta[dataset_name]["features"],
-                    roles=self.meta[dataset_name]["roles"],
+                    data=dataset[meta.features],
+                    features=meta.features,
+                    roles=meta.roles,
                     idx=test_idx,
                     name=dataset_name,
                     scheme=self.seq_params[dataset_name].get("scheme", None),
@@ -1107,11 +1373,18 @@ class DictToPandasSeqReader(PandasToPandasReader):
 
                 if array_attr == "target" and self.class_mapping is not None:
                     if len(val.shape) == 1:
-                        val = Series(val.map(self.class_mapping).values, index=plain_data.index, name=col_name)
+                        val = Series(encode_classes(val, self.class_mapping), index=plain_data.index, name=col_name)
                     else:
-                        for col in val.columns:
-                            if self.class_mapping[col] is not None:
-                                val.loc[:, col] = val.loc[:, col].map(self.class_mapping[col])
+                        # encoded columns are collected to a new frame instead of writing them back one by one
+                        val = DataFrame(
+                            {
+                                col: val[col]
+                                if self.class_mapping[col] is None
+                                else encode_classes(val[col], self.class_mapping[col])
+                                for col in val.columns
+                            },
+                            index=val.index,
+                        )
                 kwargs[array_attr] = val
 
         dataset = PandasDataset(
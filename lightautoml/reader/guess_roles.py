@@ -1,5 +1,6 @@
 """Roles guess."""
 
+from copy import deepcopy
 from typing import Any
 from typing import Dict
 from typing import List
@@ -240,9 +241,12 @@ def get_score_from_pipe(
     else:
         empty_slice = [empty_slice[:, x] for x in idx]
 
-    with Parallel(n_jobs=n_jobs, prefer="processes", backend="loky", max_nbytes=None) as p:
+    # scoring is mostly numpy work that releases the GIL, so threads share the data without pickling it
+    # every job gets its own copy of the pipe since it is fitted inside
+    with Parallel(n_jobs=n_jobs, prefer="threads", require="sharedmem") as p:
         res = p(
-            delayed(_get_score_from_pipe)(train[:, name], target, pipe, sl) for (name, sl) in zip(names, empty_slice)
+            delayed(_get_score_from_pipe)(train[:, name], target, deepcopy(pipe), sl)
+            for (name, sl) in zip(names, empty_slice)
         )
     return np.concatenate(list(map(np.array, res)))
 
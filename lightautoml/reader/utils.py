@@ -1,10 +1,12 @@
 """Reader utils."""
 
 from typing import Callable
+from typing import Mapping
 from typing import Optional
 from typing import Union
 
 import numpy as np
+import pandas as pd
 
 from sklearn.model_selection import GroupKFold
 from sklearn.model_selection import KFold
@@ -42,10 +44,49 @@ def set_sklearn_folds(
         else:
             split = KFold(cv, random_state=random_state, shuffle=True).split(target, target)
 
-        folds = np.zeros(target.shape[0], dtype=np.int32)
+        # fold index is small, so use the smallest dtype that fits it
+        folds = np.zeros(target.shape[0], dtype=np.int8 if cv <= np.iinfo(np.int8).max else np.int32)
         for n, (f0, f1) in enumerate(split):
             folds[f1] = n
 
         return folds
 
     return
+
+
+def encode_classes(values: Union[pd.Series, np.ndarray], class_mapping: Mapping) -> np.ndarray:
+    """Encode target classes with class mapping, vectorized version of ``Series.map``.
+
+    Small non negative integer classes are encoded with lookup table,
+    others - with categorical codes.
+
+    Args:
+        values: Target values.
+        class_mapping: Mapping from class to its code.
+
+    Returns:
+        Array with codes. Classes missing in mapping are set to nan.
+
+    """
+    values = np.asarray(values)
+    classes = list(class_mapping.keys())
+    codes = np.fromiter(class_mapping.values(), dtype=np.int64, count=len(classes))
+
+    if (
+        values.dtype.kind in "iu"
+        and all(isinstance(x, (int, np.integer)) and x >= 0 for x in classes)
+        and max(classes) < values.shape[0]
+    ):
+        lut = np.full(max(classes) + 1, -1, dtype=np.int64)
+        lut[classes] = codes
+        in_range = (values >= 0) & (values < lut.shape[0])
+        res = np.full(values.shape[0], -1, dtype=np.int64)
+        res[in_range] = lut[values[in_range]]
+    else:
+        pos = pd.Categorical(values, categories=classes).codes
+        res = np.where(pos >= 0, codes[pos], -1)
+
+    if (res < 0).any():
+        return np.where(res < 0, np.nan, res)
+
+    return res
@@ -1,6 +1,11 @@
 """Tools for partial installation."""
 
 import os
+import re
+
+from functools import lru_cache
+from typing import Dict
+from typing import List
 
 
 try:
@@ -14,6 +19,46 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+extra_re = re.compile(r'extra == "([^"]+)"')
+
+
+@lru_cache(maxsize=1)
+def _extras_index() -> Dict[str, List[str]]:
+    """Get requirements of lightautoml extras, metadata is parsed once.
+
+    Returns:
+        Dict with list of required libs for each extra section.
+
+    """
+    md = distribution("lightautoml").metadata
+    index = {}
+    for k, v in md.items():
+        if k == "Requires-Dist":
+            req = v.split(";")[0].split()[0]
+            for extra in set(extra_re.findall(v)):
+                index.setdefault(extra, []).append(req)
+
+    return index
+
+
+@lru_cache(maxsize=None)
+def _is_installed(lib_name: str) -> bool:
+    """Check if package is installed.
+
+    Args:
+        lib_name: Name of package.
+
+    Returns:
+        ``True`` if package is found.
+
+    """
+    try:
+        distribution(lib_name)
+    except PackageNotFoundError:
+        return False
+
+    return True
+
 
 def __validate_extra_deps(extra_section: str, error: bool = False) -> None:
     """Check if extra dependencies is installed.
@@ -25,19 +70,9 @@ def __validate_extra_deps(extra_section: str, error: bool = False) -> None:
     """
     ignore_deps = os.environ.get("DOCUMENTATION_ENV", False)
 
-    md = distribution("lightautoml").metadata
-    extra_pattern = 'extra == "{}"'.format(extra_section)
-    reqs_info = []
-    for k, v in md.items():
-        if k == "Requires-Dist" and extra_pattern in v:
-            req = v.split(";")[0].split()[0]
-            reqs_info.append(req)
-
-    for req_info in reqs_info:
+    for req_info in _extras_index().get(extra_section, ()):
         lib_name: str = req_info.split()[0]
-        try:
-            distribution(lib_name)
-        except PackageNotFoundError as e:
+        if not _is_installed(lib_name):
             # Print warning
             logger.warning(
                 "'%s' extra dependency package '%s' isn't installed. "
@@ -48,4 +83,4 @@ def __validate_extra_deps(extra_section: str, error: bool = False) -> None:
 
             if not ignore_deps:
                 if error:
-                    raise e
+                    raise PackageNotFoundError(lib_name)
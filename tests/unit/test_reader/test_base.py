@@ -0,0 +1,217 @@
+import pickle
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lightautoml.reader.base import DictToPandasSeqReader
+from lightautoml.reader.base import PandasToPandasReader
+from lightautoml.tasks import Task
+
+
+@pytest.fixture()
+def reader():
+    return PandasToPandasReader(Task("binary"))
+
+
+def guess_role(reader, values):
+    data = pd.DataFrame({"feat": pd.Series(values, dtype=object)})
+    return reader._guess_roles(data)["feat"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["1.5", "2", "nan"],
+        ["1.5", "2", "NaN", None],
+        pd.Series([1.5, np.nan, 3.0]).astype(str).tolist(),
+        ["1_000", "2"],
+        [1, 2.5, None],
+    ],
+)
+def test_guess_role_numeric_strings(reader, values):
+    assert guess_role(reader, values).name == "Numeric"
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["a", "1", "2"],
+        [[1, 2], [3], [1, 2]],
+    ],
+)
+def test_guess_role_category(reader, values):
+    assert guess_role(reader, values).name == "Category"
+
+
+def test_guess_role_datetime(reader):
+    assert guess_role(reader, ["2020-01-01", "2020-02-01", None]).name == "Datetime"
+
+
+def test_guess_roles_keep_warnings_filters(reader):
+    rng = np.random.RandomState(0)
+    # values without guessable format make pandas warn and fall back to dateutil
+    data = pd.DataFrame({"f{}".format(i): rng.choice(["1 2 3", "2 3 4", "3 4 5"], 200) for i in range(20)})
+    filters = list(warnings.filters)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        roles = reader._guess_roles(data)
+
+    assert len(roles) == data.shape[1]
+    assert len(caught) == 0
+    assert warnings.filters == filters
+
+
+@pytest.mark.parametrize("samples", [None, 1000])
+def test_fit_read_unhashable_values(samples):
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(
+        {
+            "lst": [list(range(i % 7)) for i in range(3000)],
+            "target": rng.randint(0, 2, 3000),
+        }
+    )
+    reader = PandasToPandasReader(Task("binary"), samples=samples, advanced_roles=False)
+    reader.fit_read(data, roles={"target": "target"})
+
+    assert reader.roles["lst"].name == "Category"
+
+
+def test_get_ok_features_encodes_object_columns_in_appearance_order(reader):
+    data = pd.DataFrame({"feat": ["b", "a", None, "b", "c"] * 20, "num": np.arange(100)})
+    features = reader._get_ok_features(data, ["feat", "num"])
+
+    assert list(features["feat"].cat.categories) == ["b", "a", "c"]
+    assert features["feat"].astype(object).equals(data["feat"])
+    assert features["num"] is data["num"]
+    assert data["feat"].dtype == object
+
+
+def test_unpickle_reader_without_indexes():
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame({"num": rng.rand(100), "cat": rng.choice(["a", "b"], 100), "target": rng.randint(0, 2, 100)})
+    reader = PandasToPandasReader(Task("binary"), advanced_roles=False)
+    reader.fit_read(data, roles={"target": "target"})
+    # readers pickled before indexes were added have no such attributes
+    for attr in ("_used_features_set", "_roles_by_type", "_default_roles"):
+        delattr(reader, attr)
+
+    reader = pickle.loads(pickle.dumps(reader))
+
+    assert reader.cols_by_type("Numeric") == ["num"]
+    assert reader.cols_by_type("Category") == ["cat"]
+    assert reader._used_features_set == {"num", "cat"}
+    assert reader.read(data).shape == (100, 2)
+
+
+def test_unpickle_seq_reader_with_dict_meta():
+    reader = DictToPandasSeqReader(Task("multi:reg"))
+    idx = np.arange(6).reshape(2, 3)
+    # sequences metadata was kept in dicts before
+    reader.meta = {
+        "seq": {"roles": {}, "features": ["f"], "attributes": {}, "seq_idx_data": idx, "seq_idx_target": None}
+    }
+
+    reader = pickle.loads(pickle.dumps(reader))
+
+    meta = reader.meta["seq"]
+    assert meta.features == ["f"]
+    assert meta.seq_idx_data is not None and (meta.seq_idx_data == idx).all()
+    assert meta.seq_idx_target is None
+
+
+def is_ok_feature_by_value_counts(reader, feature):
+    if feature.isnull().mean() >= reader.max_nan_rate:
+        return False
+    return (feature.value_counts().values[0] / feature.shape[0]) < reader.max_constant_rate
+
+
+@pytest.mark.parametrize(
+    "feature",
+    [
+        # integers with small range are counted with bincount
+        pd.Series([1, 1, 2, 3]),
+        pd.Series([-5, -5, -5, 7]),
+        pd.Series(np.array([-128, 127, 127, 127], dtype=np.int8)),
+        pd.Series(np.array([255, 0, 255, 1], dtype=np.uint8)),
+        pd.Series(np.array([2**64 - 1, 2**64 - 1, 2**64 - 2, 2**64 - 3], dtype=np.uint64)),
+        # others are factorized
+        pd.Series([0, 1 << 40, 1 << 40, 1 << 40]),
+        pd.Series(np.array([0, 2**63 + 5, 2**63 + 5, 1], dtype=np.uint64)),
+        pd.Series([1.0, np.nan, 2.0, 3.0]),
+        pd.Series([1.0, np.nan, np.nan, np.nan]),
+        pd.Series(["a", "a", "b", None], dtype=object),
+        pd.Series(["a", "b", "c", None], dtype=object),
+        # categorical codes are used as is
+        pd.Series(["a", "b", "a", "c"], dtype="category"),
+        pd.Series(["a", None, "a", "a"], dtype="category"),
+        pd.Series(pd.Categorical(["a", "b", "c", "c"], categories=["z", "c", "b", "a"])),
+        # unhashable values are counted with value_counts
+        pd.Series([[1], [1], [2], None], dtype=object),
+    ],
+)
+@pytest.mark.parametrize("max_nan_rate, max_constant_rate", [(0.999, 0.999), (0.5, 0.5), (0.3, 0.6)])
+def test_is_ok_feature_as_value_counts(feature, max_nan_rate, max_constant_rate):
+    reader = PandasToPandasReader(Task("binary"), max_nan_rate=max_nan_rate, max_constant_rate=max_constant_rate)
+
+    assert reader._is_ok_feature(feature) == is_ok_feature_by_value_counts(reader, feature)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.uint64, np.float64, object, "category"])
+def test_is_ok_feature_empty(reader, dtype):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert not reader._is_ok_feature(pd.Series([], dtype=dtype))
+
+
+@pytest.mark.parametrize(
+    "feature",
+    [
+        pd.to_timedelta(np.arange(5000) % 97, unit="s"),
+        pd.date_range("2020-01-01", periods=5000, freq="h"),
+        pd.array(np.arange(5000) % 13, dtype="Int64"),
+        pd.array(np.where(np.arange(5000) % 7 == 0, None, np.arange(5000) % 11), dtype="Int64"),
+        (np.arange(5000) % 200).astype(np.uint8),
+        (np.arange(5000) % 2).astype(bool),
+        pd.Categorical(np.arange(5000) % 5),
+    ],
+)
+def test_fit_read_subsample_roles(feature):
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame({"feat": feature, "target": rng.randint(0, 2, 5000)})
+    roles = {}
+    for samples in [None, 1000]:
+        reader = PandasToPandasReader(Task("binary"), samples=samples, advanced_roles=False)
+        dataset = reader.fit_read(data, roles={"target": "target"})
+        assert dataset.shape[0] == data.shape[0]
+        roles[samples] = reader.roles
+
+    assert roles[1000] == roles[None]
+
+
+def test_from_reader_copies_fitted_state():
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame({"num": rng.rand(100), "cat": rng.choice(["a", "b"], 100), "target": rng.randint(0, 2, 100)})
+    reader = PandasToPandasReader(Task("binary"), advanced_roles=False)
+    reader.fit_read(data, roles={"target": "target"})
+
+    new_reader = PandasToPandasReader.from_reader(reader)
+
+    assert new_reader.roles == reader.roles
+    assert new_reader.used_features == reader.used_features
+    assert new_reader.cols_by_type("Numeric") == ["num"]
+    assert new_reader.cols_by_type("Category") == ["cat"]
+
+    assert new_reader.read(data).shape == (100, 2)
+
+    # fit_read grows fitted containers in place
+    new_reader._roles["extra"] = new_reader.roles["num"]
+    new_reader._used_features.append("extra")
+    new_reader._used_features_set.add("extra")
+    new_reader._roles_by_type["Numeric"].append("extra")
+
+    assert "extra" not in reader.roles
+    assert reader.used_features == ["num", "cat"]
+    assert reader._used_features_set == {"num", "cat"}
+    assert reader.cols_by_type("Numeric") == ["num"]
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lightautoml.reader.utils import encode_classes
+
+
+@pytest.mark.parametrize(
+    "values, class_mapping",
+    [
+        # small non negative integers, lookup table
+        (pd.Series([0, 2, 1, 2, 0]), {0: 1, 1: 0, 2: 2}),
+        (np.array([1, 0, 1]), {0: 0, 1: 1}),
+        (pd.Series(np.array([3, 1, 3], dtype=np.uint64)), {1: 0, 3: 1}),
+        (pd.Series([True, False, True]), {False: 0, True: 1}),
+        # integers out of lookup table range
+        (pd.Series([10, 1000, 10]), {10: 0, 1000: 1}),
+        (pd.Series([0, 1, 1]), {0.0: 1, 1.0: 0}),
+        # floats, strings and mixed classes
+        (pd.Series([0.5, 1.5, 0.5]), {0.5: 0, 1.5: 1}),
+        (pd.Series([0.0, 1.0, 1.0]), {0: 0, 1: 1}),
+        (pd.Series(["b", "a", "b"]), {"a": 0, "b": 1}),
+        (pd.Series(["a", 1, "a", 2], dtype=object), {"a": 0, 1: 1, 2: 2}),
+        # nullable and categorical inputs
+        (pd.Series([0, 1, 1], dtype="Int64"), {0: 1, 1: 0}),
+        (pd.Series(["x", "y", "x"], dtype="category"), {"x": 0, "y": 1}),
+        (pd.Series([1, 2, 1], dtype="category"), {1: 0, 2: 1}),
+        (pd.Series(["x", "y", "x"], dtype="string"), {"x": 0, "y": 1}),
+    ],
+)
+def test_encode_classes_as_map(values, class_mapping):
+    res = encode_classes(values, class_mapping)
+
+    assert res.dtype == np.int64
+    np.testing.assert_array_equal(res, pd.Series(values).map(class_mapping).to_numpy(dtype=np.int64))
+
+
+@pytest.mark.parametrize(
+    "values, class_mapping",
+    [
+        (pd.Series([0, 5, -1, 1]), {0: 1, 1: 0}),
+        (pd.Series([0.5, 1.5, np.nan]), {0.5: 0, 1.5: 1}),
+        (pd.Series(["b", "a", "c", "b"]), {"a": 0, "b": 1}),
+        (pd.Series([0, 1, None, 1], dtype="Int64"), {0: 0, 1: 1}),
+        (pd.Series(["x", "z", None], dtype="category"), {"x": 0, "y": 1}),
+        (pd.Series(["x", "y", None], dtype="string"), {"x": 0, "y": 1}),
+    ],
+)
+def test_encode_classes_unseen_as_nan(values, class_mapping):
+    res = encode_classes(values, class_mapping)
+
+    assert res.dtype == np.float64
+    np.testing.assert_array_equal(res, pd.Series(values).map(class_mapping).to_numpy(dtype=np.float64, na_value=np.nan))